@@ -13,8 +13,9 @@ setup(
     extras_require={
         "dev": [
             "pytest",
-            "pytest-asyncio",
+            "pytest-asyncio>=0.26.0",
             "pytest-cov",
+            "pytest-xdist",
             "black",
             "isort",
             "mypy",
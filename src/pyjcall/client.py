@@ -23,6 +23,8 @@ logger = logging.getLogger(__name__)
 # Rate limiting constants
 DEFAULT_RATE_LIMIT = 1  # requests per minute
 RATE_LIMIT_NAMESPACE = "justcall_api"
+RATE_LIMIT_MAX_WAIT = 120  # seconds to wait for the limit to reset
+RATE_LIMIT_MIN_SLEEP = 0.01  # seconds
 
 class JustCallClient:
     def __init__(self, api_key: str, api_secret: str, rate_limit: int = DEFAULT_RATE_LIMIT):
@@ -45,16 +47,16 @@ class JustCallClient:
         self.rate = RateLimitItemPerSecond(rate_limit, 1)
         
         # Initialize resources
-        self._calls = Calls(self)
-        self._messages = Messages(self)
-        self._phone_numbers = PhoneNumbers(self)
-        self._users = Users(self)
-        self._contacts = Contacts(self)
-        self._campaigns = Campaigns(self)
-        self._campaign_contacts = CampaignContacts(self)
-        self._campaign_calls = CampaignCalls(self)
+        self.Calls = Calls(self)
+        self.Messages = Messages(self)
+        self.PhoneNumbers = PhoneNumbers(self)
+        self.Users = Users(self)
+        self.Contacts = Contacts(self)
+        self.Campaigns = Campaigns(self)
+        self.CampaignContacts = CampaignContacts(self)
+        self.CampaignCalls = CampaignCalls(self)
         
-        logger.info(f"Initialized JustCallClient with rate limit of {rate_limit} requests per minute")
+        logger.info("Initialized JustCallClient with rate limit of %s requests per minute", rate_limit)
 
     def __enter__(self):
         """Create requests session when entering context manager."""
@@ -72,6 +74,41 @@ class JustCallClient:
             self.session.close()
             self.session = None
 
+    def _acquire_rate_limit(self) -> bool:
+        """Consume one request from the rate limit, waiting for it if needed.
+        
+        Returns:
+            bool: True if the request had to wait for the limit to reset
+            
+        Raises:
+            JustCallException: If the limit does not reset within the wait period
+        """
+        rate_limiter = self.rate_limiter
+        rate = self.rate
+        
+        # hit() checks and consumes in one storage call. A rejected hit only
+        # over-counts the current window, which we wait out below anyway.
+        if rate_limiter.hit(rate, RATE_LIMIT_NAMESPACE, "api"):
+            return False
+        
+        logger.warning("Rate limit reached for justcall api, sleeping until limit is reset")
+        deadline = time.time() + RATE_LIMIT_MAX_WAIT
+        while not rate_limiter.test(rate, RATE_LIMIT_NAMESPACE, "api"):
+            now = time.time()
+            if now >= deadline:
+                raise JustCallException(
+                    status_code=429,
+                    message="Rate limit exceeded and could not recover"
+                )
+            # Sleep until the current window resets instead of polling. Index the
+            # reset time, older limits releases return a plain (reset, remaining) tuple
+            reset_time = rate_limiter.get_window_stats(rate, RATE_LIMIT_NAMESPACE, "api")[0]
+            time.sleep(min(max(reset_time - now, RATE_LIMIT_MIN_SLEEP), deadline - now))
+        
+        # If we passed the test, actually consume the quota
+        rate_limiter.hit(rate, RATE_LIMIT_NAMESPACE, "api")
+        return True
+
     def _make_request(
         self, 
         method: str, 
@@ -107,29 +144,11 @@ class JustCallClient:
         request_params = self._prepare_request_params(params) if params else None
         
         try:
-            was_blocked = False
             url = f"{self.base_url}{endpoint}"
-            logger.debug(f"Making {method} request to {url}")
+            logger.debug("Making %s request to %s", method, url)
             
             # Apply rate limiting
-            if not self.rate_limiter.test(self.rate, RATE_LIMIT_NAMESPACE, "api"):
-                logger.warning(f"Rate limit reached for justcall api, sleeping until limit is reset")
-                was_blocked = True
-
-                count = 0
-                while not self.rate_limiter.test(self.rate, RATE_LIMIT_NAMESPACE, "api") and count < 120:
-                    time.sleep(1)
-                    count += 1
-                
-                # Try again after waiting
-                if not self.rate_limiter.test(self.rate, RATE_LIMIT_NAMESPACE, "api"):
-                    raise JustCallException(
-                        status_code=429,
-                        message="Rate limit exceeded and could not recover"
-                    )
-            
-            # If we passed the test, actually consume the quota
-            self.rate_limiter.hit(self.rate, RATE_LIMIT_NAMESPACE, "api")
+            was_blocked = self._acquire_rate_limit()
             
             response = self.session.request(method, url, params=request_params, json=json)
             
@@ -160,7 +179,7 @@ class JustCallClient:
                 except ValueError:
                     # Handle case where response is not JSON despite expect_json=True
                     content = response.content
-                    logger.warning(f"Expected JSON response but got non-JSON content: {content[:100]}...")
+                    logger.warning("Expected JSON response but got non-JSON content: %s...", content[:100])
                     raise JustCallException(
                         status_code=response.status_code,
                         message="Invalid JSON response from API"
@@ -168,15 +187,18 @@ class JustCallClient:
             else:
                 return response.content
             
+        except JustCallException:
+            # Already carries the API status code, don't re-wrap it below
+            raise
         except requests.RequestException as e:
-            logger.error(f"HTTP client error: {str(e)}")
+            logger.error("HTTP client error: %s", e)
             raise JustCallException(
                 status_code=500,
                 message=f"Request failed: {str(e)}"
             )
         except Exception as e:
             # Wrap other exceptions in JustCallException
-            logger.error(f"Unexpected error during API request: {str(e)}")
+            logger.error("Unexpected error during API request: %s", e)
             raise JustCallException(
                 status_code=500,
                 message=f"Unexpected error: {str(e)}"
@@ -212,15 +234,19 @@ class JustCallClient:
         """
         items_returned = 0
         page = start_page  # Use the provided start page
+        page_in_params = method.upper() == "GET" and params is not None
+        
+        if not page_in_params and json is not None:
+            # Convert any datetime objects in JSON body once, only the page changes.
+            # Always copy, an empty body comes back as the caller's own dict
+            json = dict(self._prepare_request_params(json))
         
         while True:
             # Update page number in the appropriate request data
-            if method.upper() == "GET" and params is not None:
+            if page_in_params:
                 params[page_key] = str(page)
             elif json is not None:
                 json[page_key] = str(page)
-                # Also convert any datetime objects in JSON body
-                json = self._prepare_request_params(json)
             
             # Make the request
             response = self._make_request(
@@ -249,41 +275,6 @@ class JustCallClient:
             
             page += 1
 
-    # Resource properties
-    @property
-    def Calls(self) -> Calls:
-        return self._calls
-
-    @property
-    def Messages(self) -> Messages:
-        return self._messages
-
-    @property
-    def PhoneNumbers(self) -> PhoneNumbers:
-        return self._phone_numbers
-
-    @property
-    def Users(self) -> Users:
-        return self._users
-
-    @property
-    def Contacts(self) -> Contacts:
-        return self._contacts
-
-    @property
-    def Campaigns(self) -> Campaigns:
-        return self._campaigns
-
-    @property
-    def CampaignContacts(self) -> CampaignContacts:
-        return self._campaign_contacts
-
-    @property
-    def CampaignCalls(self) -> CampaignCalls:
-        return self._campaign_calls
-        
-
-    
     def _prepare_request_params(self, params: Dict) -> Dict:
         """Convert parameter values to appropriate string formats for API requests.
         
@@ -4,34 +4,56 @@ import os
 from pyjcall import JustCallClient
 from aioresponses import aioresponses
 
-p = os.path.join(os.path.dirname(__file__), '../../')
-dotenv.load_dotenv(p)
-# print root directory
-print("root env", p);
-# print the env variables
-print(os.environ)
+# Repository root, where example.py and the README expect the .env file
+p = os.path.realpath(os.path.join(os.path.dirname(__file__), ".."))
+
+dotenv.load_dotenv(os.path.join(p, ".env"))
 
 # Set this to True to run integration tests
 RUN_INTEGRATION_TESTS = os.environ.get("RUN_INTEGRATION_TESTS", "").lower() == "true"
 
+# Integration test credentials, read once at import
+JUSTCALL_API_KEY = os.getenv("JUSTCALL_API_KEY")
+JUSTCALL_API_SECRET = os.getenv("JUSTCALL_API_SECRET")
+HAS_CREDENTIALS = bool(JUSTCALL_API_KEY and JUSTCALL_API_SECRET)
+
+@pytest.fixture(scope="session")
+def unit_client():
+    """Return a single test client shared by all unit tests."""
+    # Generous limit so tests sharing this client don't wait on each other's window.
+    # Not entered as a context manager: the HTTP session is only created on first real request.
+    client = JustCallClient(api_key="test_key", api_secret="test_secret", rate_limit=1000)
+    yield client
+    if client.session:
+        client.session.close()
+
+@pytest.fixture
+def integration_client():
+    """Return a real client for integration tests, checked per test."""
+    if not RUN_INTEGRATION_TESTS:
+        pytest.skip("Integration tests are disabled. Set RUN_INTEGRATION_TESTS=true to enable.")
+    
+    if not HAS_CREDENTIALS:
+        pytest.skip("API credentials not found in environment")
+    
+    return JustCallClient(api_key=JUSTCALL_API_KEY, api_secret=JUSTCALL_API_SECRET)
+
 @pytest.fixture
-async def client(request):
+def client(request):
     """Return a test client for unit tests, or a real client for integration tests."""
     if request.node.get_closest_marker('integration'):
-        if not RUN_INTEGRATION_TESTS:
-            pytest.skip("Integration tests are disabled. Set RUN_INTEGRATION_TESTS=true to enable.")
-        
-        api_key = os.getenv("JUSTCALL_API_KEY")
-        api_secret = os.getenv("JUSTCALL_API_SECRET")
-        if not api_key or not api_secret:
-            pytest.skip("API credentials not found in environment")
-        
-        return JustCallClient(api_key=api_key, api_secret=api_secret)
-    else:
-        # Use test credentials for unit tests
-        return JustCallClient(api_key="test_key", api_secret="test_secret")
+        return request.getfixturevalue("integration_client")
+    return request.getfixturevalue("unit_client")
 
-@pytest.fixture
-def mock_api():
+@pytest.fixture(scope="session")
+def _mock_registry():
+    """Patch aiohttp once for the whole test run."""
     with aioresponses() as m:
         yield m
+
+@pytest.fixture
+def mock_api(_mock_registry):
+    """Return the shared aioresponses mock, reset after each test."""
+    yield _mock_registry
+    _mock_registry.clear()
+    _mock_registry.requests.clear()
@@ -0,0 +1,43 @@
+# Base URL every mocked API request is registered under
+API_BASE = "https://api.justcall.io"
+
+# Endpoints mocked by more than one test module
+USERS_URL = f"{API_BASE}/v2.1/users"
+TEXTS_URL = f"{API_BASE}/v2.1/texts"
+
+def register_pages(mock_api, method, url, payloads):
+    """Register one mocked response per payload, served in order for the same URL."""
+    register = getattr(mock_api, method)
+    for payload in payloads:
+        register(url, payload=payload)
+
+_SENTINEL = object()
+
+class Recorder:
+    """Lightweight async stand-in for _make_request that records its calls."""
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.side_effect = None
+        self.call_args = None
+        self.call_count = 0
+
+    @property
+    def side_effect(self):
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, responses):
+        # Accept any iterable of responses, not just iterators
+        self._side_effect = iter(responses) if responses is not None else None
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        if self.side_effect is not None:
+            # Serve the next response in order
+            response = next(self._side_effect, _SENTINEL)
+            if response is _SENTINEL:
+                raise AssertionError("Recorder side_effect exhausted")
+            return response
+        return self.return_value
@@ -1,27 +1,93 @@
 import pytest
 from pyjcall import JustCallClient
 from pyjcall.utils.exceptions import JustCallException
+from .helpers import API_BASE
+
+CUSTOM_FIELDS_URL = f"{API_BASE}/v1/autodialer/contacts/customfields"
+CAMPAIGN_CONTACTS_URL = f"{API_BASE}/v1/autodialer/campaigns/campaign-contacts"
+ADD_URL = f"{API_BASE}/v1/autodialer/campaigns/add"
+REMOVE_URL = f"{API_BASE}/v1/autodialer/contacts/remove"
+
+CUSTOM_FIELDS_PAYLOAD = {
+    "status": "success",
+    "data": [
+        {
+            "label": "membership_status",
+            "key": 1090960,
+            "type": "string"
+        },
+        {
+            "label": "Zip Code",
+            "key": 1091095,
+            "type": "string"
+        }
+    ]
+}
+
+LIST_PAYLOAD = {
+    "status": "success",
+    "count": 2,
+    "data": [
+        {
+            "id": 26341595,
+            "name": "John Doe",
+            "email": "",
+            "address": "",
+            "phone": "xxx-xxx-0101",
+            "1739461": "46872",
+            "1739462": None
+        },
+        {
+            "id": 26341596,
+            "name": "Jane Doe",
+            "email": "",
+            "address": "",
+            "phone": "xxx-xxx-8692",
+            "1739461": "7973",
+            "1739462": None
+        }
+    ]
+}
+
+ADD_PAYLOAD = {
+    "id": 21001,
+    "name": "John Smith",
+    "phone": "1256256256"
+}
+
+REMOVE_PAYLOAD = {
+    "status": "success",
+    "message": "The contact has been removed successfully."
+}
+
+REMOVE_ALL_PAYLOAD = {
+    "status": "success",
+    "message": "All contacts have been removed successfully."
+}
+
+ITER_ALL_PAYLOAD = {
+    "status": "success",
+    "count": 2,
+    "data": [
+        {
+            "id": 26341595,
+            "name": "John Doe",
+            "phone": "xxx-xxx-0101"
+        },
+        {
+            "id": 26341596,
+            "name": "Jane Doe",
+            "phone": "xxx-xxx-8692"
+        }
+    ]
+}
 
 @pytest.mark.asyncio
 async def test_get_custom_fields(client, mock_api):
     """Test getting custom fields for campaign contacts"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/contacts/customfields",
-        payload={
-            "status": "success",
-            "data": [
-                {
-                    "label": "membership_status",
-                    "key": 1090960,
-                    "type": "string"
-                },
-                {
-                    "label": "Zip Code",
-                    "key": 1091095,
-                    "type": "string"
-                }
-            ]
-        }
+        CUSTOM_FIELDS_URL,
+        payload=CUSTOM_FIELDS_PAYLOAD
     )
     
     response = await client.CampaignContacts.get_custom_fields()
@@ -35,31 +101,8 @@ async def test_get_custom_fields(client, mock_api):
 async def test_list_campaign_contacts(client, mock_api):
     """Test listing contacts in a campaign"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/campaign-contacts",
-        payload={
-            "status": "success",
-            "count": 2,
-            "data": [
-                {
-                    "id": 26341595,
-                    "name": "John Doe",
-                    "email": "",
-                    "address": "",
-                    "phone": "xxx-xxx-0101",
-                    "1739461": "46872",
-                    "1739462": None
-                },
-                {
-                    "id": 26341596,
-                    "name": "Jane Doe",
-                    "email": "",
-                    "address": "",
-                    "phone": "xxx-xxx-8692",
-                    "1739461": "7973",
-                    "1739462": None
-                }
-            ]
-        }
+        CAMPAIGN_CONTACTS_URL,
+        payload=LIST_PAYLOAD
     )
     
     response = await client.CampaignContacts.list(campaign_id="181449")
@@ -75,12 +118,8 @@ async def test_list_campaign_contacts(client, mock_api):
 async def test_add_campaign_contact(client, mock_api):
     """Test adding a contact to a campaign"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/add",
-        payload={
-            "id": 21001,
-            "name": "John Smith",
-            "phone": "1256256256"
-        }
+        ADD_URL,
+        payload=ADD_PAYLOAD
     )
     
     response = await client.CampaignContacts.add(
@@ -103,11 +142,8 @@ async def test_add_campaign_contact(client, mock_api):
 async def test_remove_campaign_contact(client, mock_api):
     """Test removing a contact from a campaign"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/contacts/remove",
-        payload={
-            "status": "success",
-            "message": "The contact has been removed successfully."
-        }
+        REMOVE_URL,
+        payload=REMOVE_PAYLOAD
     )
     
     response = await client.CampaignContacts.remove(
@@ -122,11 +158,8 @@ async def test_remove_campaign_contact(client, mock_api):
 async def test_remove_all_campaign_contacts(client, mock_api):
     """Test removing all contacts from a campaign"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/contacts/remove",
-        payload={
-            "status": "success",
-            "message": "All contacts have been removed successfully."
-        }
+        REMOVE_URL,
+        payload=REMOVE_ALL_PAYLOAD
     )
     
     response = await client.CampaignContacts.remove(
@@ -141,23 +174,8 @@ async def test_remove_all_campaign_contacts(client, mock_api):
 async def test_iter_all_campaign_contacts(client, mock_api):
     """Test iterating through all contacts in a campaign"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/campaign-contacts",
-        payload={
-            "status": "success",
-            "count": 2,
-            "data": [
-                {
-                    "id": 26341595,
-                    "name": "John Doe",
-                    "phone": "xxx-xxx-0101"
-                },
-                {
-                    "id": 26341596,
-                    "name": "Jane Doe",
-                    "phone": "xxx-xxx-8692"
-                }
-            ]
-        }
+        CAMPAIGN_CONTACTS_URL,
+        payload=ITER_ALL_PAYLOAD
     )
     
     contacts = []
@@ -172,23 +190,8 @@ async def test_iter_all_campaign_contacts(client, mock_api):
 async def test_iter_all_campaign_contacts_with_max_items(client, mock_api):
     """Test iterating through campaign contacts with max_items limit"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/campaign-contacts",
-        payload={
-            "status": "success",
-            "count": 2,
-            "data": [
-                {
-                    "id": 26341595,
-                    "name": "John Doe",
-                    "phone": "xxx-xxx-0101"
-                },
-                {
-                    "id": 26341596,
-                    "name": "Jane Doe",
-                    "phone": "xxx-xxx-8692"
-                }
-            ]
-        }
+        CAMPAIGN_CONTACTS_URL,
+        payload=ITER_ALL_PAYLOAD
     )
     
     contacts = []
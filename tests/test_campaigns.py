@@ -1,26 +1,89 @@
 import pytest
 from pyjcall import JustCallClient
 from pyjcall.utils.exceptions import JustCallException
+from .helpers import API_BASE, register_pages
+
+LIST_URL = f"{API_BASE}/v1/autodialer/campaigns/list"
+CREATE_URL = f"{API_BASE}/v1/autodialer/campaigns/create"
+
+LIST_PAYLOAD = {
+    "status": "success",
+    "count": "2",
+    "data": [
+        {
+            "id": 123452,
+            "name": "Outbound Sales"
+        },
+        {
+            "id": 123454,
+            "name": "Marketing"
+        }
+    ]
+}
+
+PAGINATION_PAYLOAD = {
+    "status": "success",
+    "count": "1",
+    "data": [
+        {
+            "id": 123452,
+            "name": "Outbound Sales"
+        }
+    ]
+}
+
+ITER_ALL_PAGES = (
+    # First page with page=1 in JSON body
+    {
+        "status": "success",
+        "count": "3",
+        "data": [
+            {"id": 123452, "name": "Outbound Sales"},
+            {"id": 123454, "name": "Marketing"}
+        ]
+    },
+    # Second page with page=2 in JSON body
+    {
+        "status": "success",
+        "count": "1",
+        "data": [
+            {"id": 123456, "name": "Customer Success"}
+        ]
+    },
+    # Empty third page to end pagination with page=3 in JSON body
+    {
+        "status": "success",
+        "count": "0",
+        "data": []
+    }
+)
+
+MAX_ITEMS_PAYLOAD = {
+    "status": "success",
+    "count": "3",
+    "data": [
+        {"id": 123452, "name": "Outbound Sales"},
+        {"id": 123454, "name": "Marketing"},
+        {"id": 123456, "name": "Customer Success"}
+    ]
+}
+
+CREATE_PAYLOAD = {
+    "status": "success",
+    "campaign_id": "18273803"
+}
+
+CREATE_WITH_COUNTRY_PAYLOAD = {
+    "status": "success",
+    "campaign_id": "18273804"
+}
 
 @pytest.mark.asyncio
 async def test_list_campaigns(client, mock_api):
     """Test listing campaigns"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/list",
-        payload={
-            "status": "success",
-            "count": "2",
-            "data": [
-                {
-                    "id": 123452,
-                    "name": "Outbound Sales"
-                },
-                {
-                    "id": 123454,
-                    "name": "Marketing"
-                }
-            ]
-        }
+        LIST_URL,
+        payload=LIST_PAYLOAD
     )
     
     response = await client.Campaigns.list()
@@ -34,17 +97,8 @@ async def test_list_campaigns(client, mock_api):
 async def test_list_campaigns_with_pagination(client, mock_api):
     """Test listing campaigns with pagination parameters"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/list",
-        payload={
-            "status": "success",
-            "count": "1",
-            "data": [
-                {
-                    "id": 123452,
-                    "name": "Outbound Sales"
-                }
-            ]
-        }
+        LIST_URL,
+        payload=PAGINATION_PAYLOAD
     )
     
     response = await client.Campaigns.list(page="2", per_page="10")
@@ -55,39 +109,17 @@ async def test_list_campaigns_with_pagination(client, mock_api):
 @pytest.mark.asyncio
 async def test_iter_all_campaigns(client, mock_api):
     """Test iterating through all campaigns"""
-    # First page with page=1 in JSON body
-    mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/list",
-        payload={
-            "status": "success",
-            "count": "3",
-            "data": [
-                {"id": 123452, "name": "Outbound Sales"},
-                {"id": 123454, "name": "Marketing"}
-            ]
-        }
-    )
-    
-    # Second page with page=2 in JSON body
-    mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/list",
-        payload={
-            "status": "success",
-            "count": "1",
-            "data": [
-                {"id": 123456, "name": "Customer Success"}
-            ]
-        }
+    register_pages(
+        mock_api,
+        "post",
+        LIST_URL,
+        ITER_ALL_PAGES[:-1]
     )
-    
-    # Empty third page to end pagination with page=3 in JSON body
+    # Serve the empty end page to any further request
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/list",
-        payload={
-            "status": "success",
-            "count": "0",
-            "data": []
-        }
+        LIST_URL,
+        payload=ITER_ALL_PAGES[-1],
+        repeat=True
     )
     
     # Test iteration
@@ -105,16 +137,8 @@ async def test_iter_all_campaigns_with_max_items(client, mock_api):
     """Test iterating through campaigns with max_items limit"""
     # First page with multiple items
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/list",
-        payload={
-            "status": "success",
-            "count": "3",
-            "data": [
-                {"id": 123452, "name": "Outbound Sales"},
-                {"id": 123454, "name": "Marketing"},
-                {"id": 123456, "name": "Customer Success"}
-            ]
-        }
+        LIST_URL,
+        payload=MAX_ITEMS_PAYLOAD
     )
     
     # Test iteration with max_items=2
@@ -130,11 +154,8 @@ async def test_iter_all_campaigns_with_max_items(client, mock_api):
 async def test_create_campaign(client, mock_api):
     """Test creating a campaign"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/create",
-        payload={
-            "status": "success",
-            "campaign_id": "18273803"
-        }
+        CREATE_URL,
+        payload=CREATE_PAYLOAD
     )
     
     response = await client.Campaigns.create(
@@ -150,11 +171,8 @@ async def test_create_campaign(client, mock_api):
 async def test_create_campaign_with_country_code(client, mock_api):
     """Test creating a campaign with country code"""
     mock_api.post(
-        "https://api.justcall.io/v1/autodialer/campaigns/create",
-        payload={
-            "status": "success",
-            "campaign_id": "18273804"
-        }
+        CREATE_URL,
+        payload=CREATE_WITH_COUNTRY_PAYLOAD
     )
     
     response = await client.Campaigns.create(
@@ -0,0 +1,85 @@
+import pytest
+from .helpers import API_BASE, TEXTS_URL, USERS_URL
+
+PHONE_NUMBERS_URL = f"{API_BASE}/v2.1/phone-numbers"
+
+USERS_PAYLOAD = {
+    "data": [
+        {"id": 123, "name": "John Doe", "email": "john@example.com"},
+        {"id": 124, "name": "Jane Smith", "email": "jane@example.com"}
+    ]
+}
+
+USERS_FILTERED_PAYLOAD = {
+    "data": [
+        {"id": 123, "name": "John Doe", "email": "john@example.com", "group_id": 5}
+    ]
+}
+
+PHONE_NUMBERS_PAYLOAD = {
+    "data": [
+        {"id": 123, "phone_number": "+14155552671", "capabilities": ["call", "sms"]},
+        {"id": 124, "phone_number": "+14155552672", "capabilities": ["call", "sms", "mms"]}
+    ]
+}
+
+PHONE_NUMBERS_FILTERED_PAYLOAD = {
+    "data": [
+        {"id": 123, "phone_number": "+14155552671", "capabilities": ["call", "sms"]}
+    ]
+}
+
+MESSAGES_PAYLOAD = {
+    "data": [
+        {"id": 123, "body": "Test message 1"},
+        {"id": 124, "body": "Test message 2"}
+    ]
+}
+
+# (resource, list kwargs, expected URL, mocked payload)
+LIST_CASES = (
+    pytest.param(
+        "Users",
+        {},
+        f"{USERS_URL}?order=desc&page=0&per_page=50",
+        USERS_PAYLOAD,
+        id="users"
+    ),
+    pytest.param(
+        "Users",
+        {"available": True, "group_id": 5, "order": "asc", "per_page": 10},
+        f"{USERS_URL}?available=1&group_id=5&order=asc&page=0&per_page=10",
+        USERS_FILTERED_PAYLOAD,
+        id="users_with_filters"
+    ),
+    pytest.param(
+        "PhoneNumbers",
+        {},
+        f"{PHONE_NUMBERS_URL}?per_page=30",
+        PHONE_NUMBERS_PAYLOAD,
+        id="phone_numbers"
+    ),
+    pytest.param(
+        "PhoneNumbers",
+        {"capabilities": "sms", "number_type": "local", "per_page": 10},
+        f"{PHONE_NUMBERS_URL}?capabilities=sms&number_type=local&per_page=10",
+        PHONE_NUMBERS_FILTERED_PAYLOAD,
+        id="phone_numbers_with_filters"
+    ),
+    pytest.param(
+        "Messages",
+        {"per_page": 20},
+        f"{TEXTS_URL}?order=desc&per_page=20&sort=id",
+        MESSAGES_PAYLOAD,
+        id="messages"
+    )
+)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resource,kwargs,url,payload", LIST_CASES)
+async def test_list_endpoint(client, mock_api, resource, kwargs, url, payload):
+    """Test listing users, phone numbers and SMS messages with and without filters"""
+    mock_api.get(url, payload=payload)
+
+    response = await getattr(client, resource).list(**kwargs)
+    assert response["data"] == payload["data"]
@@ -1,30 +1,14 @@
 import pytest
 from pyjcall import JustCallClient
 from pyjcall.utils.exceptions import JustCallException
-
-@pytest.mark.asyncio
-async def test_list_messages(client, mock_api):
-    """Test listing SMS messages with pagination and filters"""
-    mock_api.get(
-        "https://api.justcall.io/v2.1/texts?order=desc&per_page=20&sort=id",
-        payload={
-            "data": [
-                {"id": 123, "body": "Test message 1"},
-                {"id": 124, "body": "Test message 2"}
-            ]
-        }
-    )
-    
-    response = await client.Messages.list(per_page=20)
-    assert len(response["data"]) == 2
-    assert response["data"][0]["id"] == 123
+from .helpers import TEXTS_URL
 
 @pytest.mark.asyncio
 async def test_get_message(client, mock_api):
     """Test getting a specific SMS message by ID"""
     message_id = 123
     mock_api.get(
-        f"https://api.justcall.io/v2.1/texts/{message_id}",
+        f"{TEXTS_URL}/{message_id}",
         payload={"id": message_id, "body": "Test message"}
     )
     
@@ -36,7 +20,7 @@ async def test_get_message(client, mock_api):
 async def test_send_message(client, mock_api):
     """Test sending an SMS message"""
     mock_api.post(
-        "https://api.justcall.io/v2.1/texts",
+        TEXTS_URL,
         payload={"id": 123, "status": "sent"}
     )
     
@@ -51,7 +35,7 @@ async def test_send_message(client, mock_api):
 async def test_send_new_message(client, mock_api):
     """Test sending a new SMS message"""
     mock_api.post(
-        "https://api.justcall.io/v2.1/texts/new",
+        f"{TEXTS_URL}/new",
         payload={"id": 123, "status": "sent"}
     )
     
@@ -66,7 +50,7 @@ async def test_send_new_message(client, mock_api):
 async def test_check_reply(client, mock_api):
     """Test checking for SMS replies"""
     mock_api.post(
-        "https://api.justcall.io/v2.1/texts/checkreply",
+        f"{TEXTS_URL}/checkreply",
         payload={
             "has_reply": True,
             "replies": [
@@ -86,7 +70,7 @@ async def test_check_reply(client, mock_api):
 async def test_error_handling(client, mock_api):
     """Test error handling for SMS endpoints"""
     mock_api.get(
-        "https://api.justcall.io/v2.1/texts/999",
+        f"{TEXTS_URL}/999",
         status=404,
         payload={"message": "SMS not found"}
     )